@@ -1,9 +1,21 @@
 import os
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+DEFAULT_CONFIG = {
+    "allowed_extensions": [".py", ".txt", ".json", ".env", ".yml", ".yaml", ".dockerfile", "Dockerfile", ".gitignore", ".dockerignore"],
+    "ignored_dirs": [".git", "__pycache__", ".idea", ".vscode", "node_modules", "venv", ".env", "dist", "build"]
+}
+
+# Delimiters around each dumped file, encoded once up front
+FILE_HEADER_START = b"<<FILE>>\nFILE_PATH: "
+FILE_HEADER_END = b"\n<<CONTENT_START>>\n"
+FILE_FOOTER = b"<<CONTENT_END>>\n\n"
+
 def load_config(config_path):
     """Load configuration from a JSON file."""
     try:
@@ -17,110 +29,171 @@ def load_config(config_path):
         return config
     except FileNotFoundError:
         print(f"Configuration file '{config_path}' not found. Using default configuration.")
-        return {
-            "allowed_extensions": [".py", ".txt", ".json", ".env", ".yml", ".yaml", ".dockerfile", "Dockerfile", ".gitignore", ".dockerignore"],
-            "ignored_dirs": [".git", "__pycache__", ".idea", ".vscode", "node_modules", "venv", ".env", "dist", "build"]
-        }
+        return DEFAULT_CONFIG
     except json.JSONDecodeError:
         print(f"Error parsing configuration file '{config_path}'. Using default configuration.")
-        return {
-            "allowed_extensions": [".py", ".txt", ".json", ".env", ".yml", ".yaml", ".dockerfile", "Dockerfile", ".gitignore", ".dockerignore"],
-            "ignored_dirs": [".git", "__pycache__", ".idea", ".vscode", "node_modules", "venv", ".env", "dist", "build"]
-        }
+        return DEFAULT_CONFIG
 
-def is_allowed_file(file_path, allowed_extensions):
-    """Check if a file should be included based on its extension."""
-    _, ext = os.path.splitext(file_path)
-    
+@lru_cache(maxsize=None)
+def get_extension(file_path):
+    """Return the lower-cased extension of a path, cached since file names repeat across directories."""
+    return os.path.splitext(file_path)[1].lower()
+
+def is_allowed_file(file_name, allowed_extensions):
+    """Check if a file should be included based on its extension or name."""
     # Check if the extension or full filename is in allowed_extensions
-    return ext.lower() in allowed_extensions or os.path.basename(file_path) in allowed_extensions
+    return get_extension(file_name) in allowed_extensions or file_name in allowed_extensions
+
+def is_dir_entry(entry):
+    """Check if a directory entry is a directory, treating errors as False like os.path.isdir."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+def is_file_entry(entry):
+    """Check if a directory entry is a file, treating errors as False like os.path.isfile."""
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
 
 def get_tree_structure(path, prefix="", ignored_dirs=None, allowed_extensions=None, processed_files=None):
-    """Generate a tree structure of the directory."""
+    """Generate the lines of a tree structure of the directory."""
     if ignored_dirs is None:
-        ignored_dirs = []
+        ignored_dirs = frozenset()
     if allowed_extensions is None:
-        allowed_extensions = []
+        allowed_extensions = frozenset()
     if processed_files is None:
-        processed_files = set()
+        processed_files = []
     
-    tree_output = ""
-    items = sorted(os.listdir(path))
+    tree_lines = []
     
-    # First, add directories
-    dirs = [item for item in items if os.path.isdir(os.path.join(path, item)) and item not in ignored_dirs]
-    for i, dir_name in enumerate(dirs):
-        is_last_dir = i == len(dirs) - 1
-        dir_path = os.path.join(path, dir_name)
+    # Walk depth-first with an explicit stack of (line, directory, prefix, relative path) items.
+    # Children are pushed in reverse so they are popped in tree order.
+    stack = [(None, path, prefix, "")]
+    while stack:
+        line, dir_path, dir_prefix, rel_dir = stack.pop()
+        if line is not None:
+            tree_lines.append(line)
+        if dir_path is None:
+            continue
+        
+        # scandir entries cache the file type, so classifying them needs no extra stat calls
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        children = []
         
-        # Add directory to the tree
-        tree_output += f"{prefix}{'└── ' if is_last_dir else '├── '}{dir_name}/\n"
+        # First, add directories. Ignored ones are pruned here, so they are never scanned.
+        dirs = [entry for entry in entries if entry.name not in ignored_dirs and is_dir_entry(entry)]
+        for i, dir_entry in enumerate(dirs):
+            is_last_dir = i == len(dirs) - 1
+            
+            # Add directory to the tree, followed by its contents with an updated prefix
+            dir_line = f"{dir_prefix}{'└── ' if is_last_dir else '├── '}{dir_entry.name}/"
+            new_prefix = f"{dir_prefix}{'    ' if is_last_dir else '│   '}"
+            children.append((dir_line, dir_entry.path, new_prefix, f"{rel_dir}{dir_entry.name}{os.sep}"))
         
-        # Process subdirectory with updated prefix
-        new_prefix = f"{prefix}{'    ' if is_last_dir else '│   '}"
-        tree_output += get_tree_structure(
-            dir_path, 
-            new_prefix, 
-            ignored_dirs, 
-            allowed_extensions, 
-            processed_files
-        )
-    
-    # Then, add files
-    files = [item for item in items if os.path.isfile(os.path.join(path, item))]
-    allowed_files = [f for f in files if is_allowed_file(f, allowed_extensions)]
-    
-    for i, file_name in enumerate(allowed_files):
-        is_last_file = i == len(allowed_files) - 1
-        file_path = os.path.join(path, file_name)
+        # Then, add files
+        files = [entry for entry in entries if is_file_entry(entry)]
+        allowed_files = [entry for entry in files if is_allowed_file(entry.name, allowed_extensions)]
         
-        # Add file to the tree and to processed files
-        tree_output += f"{prefix}{'└── ' if is_last_file else '├── '}{file_name}\n"
-        processed_files.add(os.path.abspath(file_path))
+        for i, file_entry in enumerate(allowed_files):
+            is_last_file = i == len(allowed_files) - 1
+            
+            # Add file to the tree and its absolute and relative paths to processed files
+            file_line = f"{dir_prefix}{'└── ' if is_last_file else '├── '}{file_entry.name}"
+            children.append((file_line, None, None, None))
+            processed_files.append((file_entry.path, f"{rel_dir}{file_entry.name}"))
+        
+        stack.extend(reversed(children))
     
-    return tree_output
+    return tree_lines
+
+def read_file_bytes(file_path):
+    """Read a whole file with unbuffered reads into a buffer sized from its stat."""
+    with open(file_path, 'rb', buffering=0) as file:
+        size = os.fstat(file.fileno()).st_size
+        data = bytearray(size)
+        
+        read = 0
+        with memoryview(data) as view:
+            while read < size:
+                n = file.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+        
+        # The file may have shrunk or grown since it was stat'ed
+        if read < size:
+            del data[read:]
+        else:
+            data += file.read()
+    return data
+
+def read_file_contents(file_path):
+    """Read a file as UTF-8 bytes, normalizing newlines and replacing undecodable bytes."""
+    try:
+        data = read_file_bytes(file_path)
+    except Exception as e:
+        return f"[Error reading file: {str(e)}]\n".encode('utf-8')
+    
+    # Match what a text-mode read would have produced
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    if not data.isascii():
+        data = data.decode('utf-8', errors='replace').encode('utf-8')
+    return data
 
 def dump_file_contents(path, output_file, ignored_dirs, allowed_extensions):
     """Dump the contents of allowed files to the output file."""
-    processed_files = set()
+    # Resolve the root once; every path collected during the walk is then already absolute
+    path = os.path.abspath(path)
+    processed_files = []
     
-    # First, create and write the tree structure
-    tree_structure = get_tree_structure(
+    # First, create and write the tree structure, collecting the files to dump on the way
+    tree_lines = get_tree_structure(
         path, 
         ignored_dirs=ignored_dirs, 
         allowed_extensions=allowed_extensions,
         processed_files=processed_files
     )
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # Write header with clear delimiters
-        f.write("<<PROJECT_INFO>>\n")
-        f.write(f"PROJECT_PATH: {os.path.abspath(path)}\n")
-        f.write(f"GENERATED_DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("<<PROJECT_INFO_END>>\n\n")
-        
-        # Write tree structure
-        f.write("<<DIRECTORY_STRUCTURE>>\n")
-        f.write(f"{os.path.basename(path)}/\n")
-        f.write(tree_structure)
-        f.write("<<DIRECTORY_STRUCTURE_END>>\n\n")
-        
-        # Write file contents with clear delimiters
-        file_count = 0
-        for file_path in sorted(processed_files):
-            rel_path = os.path.relpath(file_path, path)
-            f.write(f"<<FILE>>\n")
-            f.write(f"FILE_PATH: {rel_path}\n")
-            f.write("<<CONTENT_START>>\n")
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                    f.write(file.read())
-            except Exception as e:
-                f.write(f"[Error reading file: {str(e)}]\n")
-            
-            f.write("<<CONTENT_END>>\n\n")
+    # Accumulate the whole dump in memory and write it out in one go
+    out = bytearray()
+    
+    # Write header with clear delimiters
+    out += b"<<PROJECT_INFO>>\n"
+    out += f"PROJECT_PATH: {path}\n".encode('utf-8')
+    out += f"GENERATED_DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n".encode('utf-8')
+    out += b"<<PROJECT_INFO_END>>\n\n"
+    
+    # Write tree structure
+    out += b"<<DIRECTORY_STRUCTURE>>\n"
+    out += f"{os.path.basename(path)}/\n".encode('utf-8')
+    out += "".join(f"{line}\n" for line in tree_lines).encode('utf-8')
+    out += b"<<DIRECTORY_STRUCTURE_END>>\n\n"
+    
+    # Write file contents with clear delimiters. Files are read on a thread pool
+    # so their I/O overlaps, while map() keeps the results in order.
+    file_count = 0
+    processed_files.sort()
+    file_paths = [file_path for file_path, _ in processed_files]
+    with ThreadPoolExecutor() as executor:
+        for (_, rel_path), content in zip(processed_files, executor.map(read_file_contents, file_paths)):
+            out += FILE_HEADER_START
+            out += rel_path.encode('utf-8')
+            out += FILE_HEADER_END
+            out += content
+            out += FILE_FOOTER
             file_count += 1
+    
+    # Write newlines as os.linesep, as the text-mode output file used to
+    if os.linesep != '\n':
+        out = out.replace(b'\n', os.linesep.encode('ascii'))
+    
+    with open(output_file, 'wb') as f:
+        f.write(out)
             
     return file_count
 
@@ -148,8 +221,8 @@ def main():
     print(f"Allowing extensions/files: {allowed_extensions}")
     print(f"Output file: {args.output}")
     
-    # Generate the dump
-    file_count = dump_file_contents(project_path, args.output, ignored_dirs, allowed_extensions)
+    # Generate the dump, using sets for the per-entry membership checks
+    file_count = dump_file_contents(project_path, args.output, frozenset(ignored_dirs), frozenset(allowed_extensions))
     
     print(f"Project dump successfully created: {args.output}")
     print(f"Included {file_count} files in the dump.")
@@ -1,35 +1,150 @@
 import os
-import re
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 
-def parse_project_dump(dump_file):
-    """Parse a project dump file and extract the directory structure and file contents."""
-    with open(dump_file, 'r', encoding='utf-8', errors='replace') as f:
-        content = f.read()
+CHUNK_SIZE = 1 << 20
+HEADER_SEARCH_LIMIT = 1 << 20
+MAX_PENDING_WRITES = 64
+NEWLINE = os.linesep.encode('ascii')
+
+PROJECT_PATH_MARKER = b'<<PROJECT_INFO>>\nPROJECT_PATH: '
+FILE_MARKER = b'<<FILE>>\nFILE_PATH: '
+CONTENT_START_MARKER = b'\n<<CONTENT_START>>\n'
+CONTENT_END_MARKER = b'<<CONTENT_END>>'
+
+
+def read_chunks(f, chunk_size=CHUNK_SIZE):
+    """Read a binary file in chunks, translating line endings the way text mode does."""
+    pending = b''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            if pending:
+                yield b'\n'
+            return
+        
+        if pending:
+            chunk = pending + chunk
+            pending = b''
+        
+        # Hold back a trailing '\r' in case the next chunk starts with '\n'
+        if chunk.endswith(b'\r'):
+            chunk, pending = chunk[:-1], b'\r'
+        if b'\r' in chunk:
+            chunk = chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        yield chunk
+
+
+def find_marker(buffer, chunks, marker, start):
+    """Find a marker in the buffer at or after start, reading more chunks until it shows up."""
+    while True:
+        index = buffer.find(marker, start)
+        if index != -1:
+            return index
+        
+        chunk = next(chunks, None)
+        if chunk is None:
+            return -1
+        
+        # Only the tail that could hold a partial marker needs to be searched again
+        start = max(start, len(buffer) - len(marker) + 1)
+        buffer += chunk
+
+
+def iter_file_sections(buffer, chunks):
+    """Yield (file_path, content) pairs for each file section in the dump."""
+    while True:
+        file_start = find_marker(buffer, chunks, FILE_MARKER, 0)
+        if file_start == -1:
+            return
+        
+        path_start = file_start + len(FILE_MARKER)
+        path_end = find_marker(buffer, chunks, CONTENT_START_MARKER, path_start + 1)
+        if path_end == -1:
+            return
+        
+        content_start = path_end + len(CONTENT_START_MARKER)
+        content_end = find_marker(buffer, chunks, CONTENT_END_MARKER, content_start)
+        if content_end == -1:
+            return
+        
+        file_path = buffer[path_start:path_end].decode('utf-8', errors='replace')
+        content = bytes(buffer[content_start:content_end])
+        
+        # Drop the consumed section so the buffer only ever holds the current file
+        del buffer[:content_end + len(CONTENT_END_MARKER)]
+        yield file_path, content
 
-    # Extract project name from header
-    project_name_match = re.search(r'<<PROJECT_INFO>>\nPROJECT_PATH: (.+)\n', content)
-    project_name = os.path.basename(project_name_match.group(1)) if project_name_match else "undumped_project"
+
+def read_project_name(buffer, chunks):
+    """Extract the project name from the dump header, which precedes the first file section."""
+    # Only look at a bounded prefix of the dump, and never past the first file section
+    while len(buffer) < HEADER_SEARCH_LIMIT and FILE_MARKER not in buffer:
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        buffer += chunk
     
-    # Parse file contents section
-    file_contents = {}
+    header_end = buffer.find(FILE_MARKER, 0, HEADER_SEARCH_LIMIT)
+    header = buffer[:header_end if header_end != -1 else HEADER_SEARCH_LIMIT]
     
-    # Find all file sections using the distinct start and end delimiters
-    file_pattern = r'<<FILE>>\nFILE_PATH: (.+?)\n<<CONTENT_START>>\n(.*?)<<CONTENT_END>>'
+    name_start = header.find(PROJECT_PATH_MARKER)
+    while name_start != -1:
+        name_start += len(PROJECT_PATH_MARKER)
+        name_end = header.find(b'\n', name_start)
+        if name_end == -1:
+            break
+        if name_end > name_start:
+            project_path = header[name_start:name_end].decode('utf-8', errors='replace')
+            return os.path.basename(project_path)
+        name_start = header.find(PROJECT_PATH_MARKER, name_start)
     
-    for match in re.finditer(file_pattern, content, re.DOTALL):
-        file_path = match.group(1)
-        file_content = match.group(2)
-        file_contents[file_path] = file_content
+    return "undumped_project"
+
+
+def iter_dump_files(dump_file):
+    """Yield (file_path, content) pairs from a dump file, opening it only once iteration starts."""
+    with open(dump_file, 'rb') as f:
+        yield from iter_file_sections(bytearray(), read_chunks(f))
+
+
+def parse_project_dump(dump_file):
+    """Parse a project dump file, returning the project name and a generator of (file_path, content) pairs."""
+    with open(dump_file, 'rb') as f:
+        project_name = read_project_name(bytearray(), read_chunks(f))
     
-    return project_name, file_contents
+    # Files are parsed lazily, so only one file's content is held in memory at a time
+    return project_name, iter_dump_files(dump_file)
 
 
-def recreate_project(output_dir, project_name, file_contents, verbose=False):
-    """Recreate the project structure from the parsed dump."""
+def write_file_bytes(file_path, content):
+    """Write bytes to a file with plain os-level calls, bypassing the buffered file object."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with memoryview(content) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+def wait_for_writes(pending_writes, limit, verbose=False):
+    """Wait for queued writes until at most limit remain in flight."""
+    while len(pending_writes) > limit:
+        full_path, future = pending_writes.popleft()
+        future.result()
+        
+        if verbose:
+            print(f"Created file: {full_path}")
+
+
+def recreate_project(output_dir, project_name, file_sections, verbose=False):
+    """Recreate the project structure from the parsed dump and return the number of files written."""
     # Create the project root directory
     project_dir = Path(output_dir) / project_name
     
@@ -37,24 +152,53 @@ def recreate_project(output_dir, project_name, file_contents, verbose=False):
         project_dir.mkdir(parents=True, exist_ok=True)
         print(f"Created project directory: {project_dir}")
         
-        # Process all files
-        for file_path, content in file_contents.items():
-            full_path = project_dir / file_path
-            
-            # Create parent directories if they don't exist
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write file content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        # Work with plain strings in the per-file loop, which is much cheaper than pathlib.
+        # Track directories known to exist so each one is only created once.
+        root = str(project_dir)
+        created_dirs = {root}
+        
+        # Process files as they are parsed, handing the writes to a thread pool so
+        # their I/O overlaps. The number of writes in flight is bounded so parsed
+        # contents don't pile up in memory.
+        pending_writes = deque()
+        last_writes = {}
+        written_paths = set()
+        with ThreadPoolExecutor() as executor:
+            for file_path, content in file_sections:
+                full_path = os.path.join(root, file_path)
+                
+                # Create parent directories if they don't exist
+                parent = os.path.dirname(full_path)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    while parent and parent not in created_dirs:
+                        created_dirs.add(parent)
+                        parent = os.path.dirname(parent)
+                
+                # Wait for any earlier write to the same file so the last section still wins.
+                # Paths are case-folded because the filesystem may be case-insensitive
+                # (as on macOS and Windows); on case-sensitive ones this only costs a wait.
+                path_key = os.path.normcase(full_path).casefold()
+                previous_write = last_writes.get(path_key)
+                if previous_write is not None:
+                    previous_write.result()
+                
+                # Write file content, with newlines as os.linesep like a text-mode write
+                if NEWLINE != b'\n':
+                    content = content.replace(b'\n', NEWLINE)
+                future = executor.submit(write_file_bytes, full_path, content)
+                last_writes[path_key] = future
+                pending_writes.append((full_path, future))
+                written_paths.add(file_path)
+                wait_for_writes(pending_writes, MAX_PENDING_WRITES, verbose)
             
-            if verbose:
-                print(f"Created file: {full_path}")
+            wait_for_writes(pending_writes, 0, verbose)
         
-        return True
+        # Repeated paths overwrite each other, so count the distinct paths in the dump
+        return len(written_paths)
     except Exception as e:
         print(f"Error recreating project: {e}")
-        return False
+        return None
 
 
 def main():
@@ -72,7 +216,7 @@ def main():
     # Parse the dump file
     print(f"Parsing dump file: {args.dump_file}")
     start_time = datetime.now()
-    project_name, file_contents = parse_project_dump(args.dump_file)
+    project_name, file_sections = parse_project_dump(args.dump_file)
     
     # Create the output directory if it doesn't exist
     output_dir = Path(args.output)
@@ -80,14 +224,14 @@ def main():
     
     # Recreate the project
     print(f"Recreating project '{project_name}' in {output_dir}")
-    success = recreate_project(output_dir, project_name, file_contents, args.verbose)
+    file_count = recreate_project(output_dir, project_name, file_sections, args.verbose)
     
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
     
-    if success:
+    if file_count is not None:
         print(f"Project successfully undumped into {output_dir / project_name}")
-        print(f"Recreated {len(file_contents)} files in {duration:.2f} seconds.")
+        print(f"Recreated {file_count} files in {duration:.2f} seconds.")
     else:
         print("Failed to recreate project from dump.")
 